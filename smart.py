@@ -2,21 +2,31 @@
 import os
 import sys
 import re
+import bisect
+import collections
 import webbrowser
 import importlib.util
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich import print
 from rich.prompt import Prompt
 from dotenv import load_dotenv
-from openai import OpenAI
 
 # ----------------------------
 # Environment Setup
 # ----------------------------
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+client = None
+
+def get_client():
+    """Import openai and create the client on first use so startup does no AI setup."""
+    global client
+    if client is None and OPENAI_API_KEY:
+        from openai import OpenAI
+        client = OpenAI(api_key=OPENAI_API_KEY)
+    return client
 
 # ----------------------------
 # Globals
@@ -29,32 +39,33 @@ last_error = None
 # ----------------------------
 # Language Detection
 # ----------------------------
+LANGUAGE_BY_EXTENSION = {".py": "python", ".js": "nodejs", ".java": "java"}
+
 def detect_language_from_file(file_path: Path):
-    ext = file_path.suffix.lower()
-    if ext == ".py":
-        return "python"
-    elif ext == ".js":
-        return "nodejs"
-    elif ext == ".java":
-        return "java"
-    else:
-        return "unknown"
+    return LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower(), "unknown")
 
 # ----------------------------
 # Dependency Detection
 # ----------------------------
+PYTHON_IMPORT_RE = re.compile(
+    r'^[ \t]*(?:from[ \t]+([A-Za-z_]\w*)|import[ \t]+([A-Za-z_][\w. \t,]*))', re.MULTILINE)
+NODE_REQUIRE_RE = re.compile(r'require\([\'"](\w+)[\'"]\)')
+
 def detect_python_dependencies(code: str):
     deps = set()
-    for line in code.splitlines():
-        line = line.strip()
-        if line.startswith("import "):
-            deps.add(line.split()[1].split('.')[0])
-        elif line.startswith("from "):
-            deps.add(line.split()[1].split('.')[0])
+    for from_name, import_names in PYTHON_IMPORT_RE.findall(code):
+        if from_name:
+            deps.add(from_name)
+            continue
+        # "import a.b as c, d" -> a, d
+        for part in import_names.split(","):
+            words = part.split()
+            if words:
+                deps.add(words[0].split(".")[0])
     return list(deps)
 
 def detect_node_dependencies(code: str):
-    return list(set(re.findall(r'require\([\'"](\w+)[\'"]\)', code)))
+    return list(set(NODE_REQUIRE_RE.findall(code)))
 
 # ----------------------------
 # AI-Powered Fix (File Only)
@@ -82,7 +93,7 @@ Suggest fixes, missing imports, or dependency installations needed to fix this e
 Provide a concise explanation.
 """
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3   )
@@ -193,7 +204,7 @@ Provide a concise optimization plan.
         return
 
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3 )
@@ -203,28 +214,97 @@ Provide a concise optimization plan.
         print(f"[red]AI optimization failed: {e}[/red]")
 
 
+SKIP_DIRS = {".git", "node_modules", "__pycache__"}
+SEARCH_EXTENSIONS = (".py", ".js", ".java", ".txt", ".md")
+
+def iter_files(root: Path, extensions: tuple):
+    """Walk root once with os.walk, pruning SKIP_DIRS, and yield files ending in extensions."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            if name.lower().endswith(extensions):
+                yield Path(dirpath, name)
+
+def read_file_bytes(path: Path) -> bytes:
+    """Read a file with raw os.open/os.read, skipping Python's buffered IO layers."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+def read_search_candidate(path: Path):
+    """Return (path, content, error) so one unreadable file doesn't abort a search."""
+    try:
+        return path, read_file_bytes(path), None
+    except Exception as e:
+        return path, None, e
+
+def iter_prefetched(executor, fn, items, window: int):
+    """Like executor.map, but keep at most `window` calls in flight ahead of the consumer."""
+    pending = collections.deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+# Line boundaries recognised by str.splitlines(), as they appear in UTF-8 bytes.
+LINE_BREAK_RE = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+def find_matching_lines(content: bytes, query: bytes):
+    """Yield (line_number, line) for each line of content containing query.
+
+    Lines are split the same way as str.splitlines() on the decoded text.
+    """
+    breaks = None
+    pos = 0
+    while pos < len(content):
+        idx = content.find(query, pos)
+        if idx == -1:
+            break
+        if breaks is None:
+            breaks = [m.span() for m in LINE_BREAK_RE.finditer(content)]
+            break_starts = [b[0] for b in breaks]
+        line_no = bisect.bisect_left(break_starts, idx)
+        start = breaks[line_no - 1][1] if line_no else 0
+        end = breaks[line_no][0] if line_no < len(breaks) else len(content)
+        if idx < start or idx + len(query) > end:
+            pos = idx + 1
+            continue
+        yield line_no + 1, content[start:end]
+        pos = breaks[line_no][1] if line_no < len(breaks) else len(content)
 
 def search_codebase(query: str, directory: Path = Path(".")):
     if not directory.exists() or not directory.is_dir():
         print(f"[red]Directory not found: {directory}[/red]")
         return
     print(f"[blue]Searching for '{query}' in {directory}...[/blue]")
-    for file_path in directory.rglob("*.*"):
-        if file_path.suffix.lower() not in [".py",".js",".java",".txt",".md"]:
-            continue
-        try:
-            for i, line in enumerate(file_path.read_text(errors="ignore").splitlines(), 1):
-                if query in line:
-                    print(f"[green]{file_path}:{i}[/green] {line.strip()}")
-        except Exception as e:
-            print(f"[yellow]Cannot read {file_path}: {e}[/yellow]")
+    needle = query.encode("utf-8")
+    files = iter_files(directory, SEARCH_EXTENSIONS)
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file_path, content, error in iter_prefetched(executor, read_search_candidate, files, workers * 2):
+            if error is not None:
+                print(f"[yellow]Cannot read {file_path}: {error}[/yellow]")
+                continue
+            for i, line in find_matching_lines(content, needle):
+                print(f"[green]{file_path}:{i}[/green] {line.decode('utf-8', 'ignore').strip()}")
 def doc_lookup(query: str):
     """AI-powered documentation lookup for a given programming term or function."""
     if not OPENAI_API_KEY:
         return print("[yellow]⚠️ OpenAI API key not set. Documentation lookup disabled.[/yellow]")
 
     try:
-        response = client.chat.completions.create(
+        response = get_client().chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": (
                 f"You are a programming documentation assistant.\n"